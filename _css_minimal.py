@@ -0,0 +1,19 @@
+"""
+Minimal dashboard template styles.
+Loaded on demand by notebook_dashboard for the 'minimal' template.
+"""
+
+CSS = """
+        body {
+            font-family: Arial, sans-serif;
+            margin: 20px;
+            line-height: 1.5;
+        }
+        .content, .plot {
+            margin-bottom: 20px;
+        }
+        .plot-image, .plot-svg {
+            max-width: 100%;
+            height: auto;
+        }
+        """
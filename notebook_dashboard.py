@@ -4,13 +4,122 @@ Jupyter Notebook Dashboard Generator
 Converts Jupyter notebooks to static HTML dashboards by extracting plots and markdown content.
 """
 
+import html
+import importlib
 import json
-import base64
 import re
+import string
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from urllib.parse import quote
+from typing import List, Dict, Any, Optional, Callable, Iterator, TextIO, Tuple
 import argparse
 from datetime import datetime
+from functools import lru_cache
+from multiprocessing import Pool
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Markdown conversion patterns, compiled once at import time. Block-level
+# and inline syntax and paragraph breaks share a single alternation so each
+# cell is scanned in one pass; alternatives are ordered so code blocks win
+# over inline code and bold wins over italic when both start at the same
+# position. Italic never opens on, and skips over, a ** delimiter so bold
+# nested inside italic is left for the inline pass.
+_MD_COMBINED = re.compile(
+    r'(?P<codeblock>(?s:```(.+?)```))'
+    r'|(?P<inlinecode>`(.+?)`)'
+    r'|(?P<h3>^### (.+)$)'
+    r'|(?P<h2>^## (.+)$)'
+    r'|(?P<h1>^# (.+)$)'
+    r'|(?P<bolditalic>\*\*\*(.+?)\*\*\*)'
+    r'|(?P<bold>\*\*(.+?)\*\*)'
+    r'|(?P<italic>\*(?!\*)((?:\*\*.+?\*\*|[^*\n])+?)\*(?!\*))'
+    r'|(?P<para>\n\n)',
+    re.MULTILINE
+)
+# Inline-only subset, applied to the text inside headers, bold and italic
+_MD_INLINE = re.compile(
+    r'(?P<inlinecode>`(.+?)`)'
+    r'|(?P<bolditalic>\*\*\*(.+?)\*\*\*)'
+    r'|(?P<bold>\*\*(.+?)\*\*)'
+    r'|(?P<italic>\*(?!\*)((?:\*\*.+?\*\*|[^*\n])+?)\*(?!\*))'
+)
+_MD_TAGS = {
+    'codeblock': ('<pre><code>', '</code></pre>'),
+    'inlinecode': ('<code>', '</code>'),
+    'h3': ('<h3>', '</h3>'),
+    'h2': ('<h2>', '</h2>'),
+    'h1': ('<h1>', '</h1>'),
+    'bolditalic': ('<strong><em>', '</em></strong>'),
+    'bold': ('<strong>', '</strong>'),
+    'italic': ('<em>', '</em>'),
+}
+_TITLE_H1_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+
+def _md_replace(match: re.Match) -> str:
+    """Render a single markdown match from _MD_COMBINED or _MD_INLINE."""
+    kind = match.lastgroup
+    if kind == 'para':
+        return '</p><p>'
+    text = match.group(match.lastindex + 1)
+    if kind not in ('codeblock', 'inlinecode'):
+        text = _MD_INLINE.sub(_md_replace, text)
+    open_tag, close_tag = _MD_TAGS[kind]
+    return f'{open_tag}{text}{close_tag}'
+
+# Output types that can carry plots, and the image formats taken from them
+_PLOT_OUTPUT_TYPES = frozenset({'display_data', 'execute_result'})
+_IMAGE_MIME_TYPES = ('image/png', 'image/jpeg', 'image/svg+xml')
+
+# File extensions used when plots are written out as separate assets
+_ASSET_EXTENSIONS = {
+    'image/png': 'png',
+    'image/jpeg': 'jpg',
+    'image/svg+xml': 'svg',
+}
+
+# Page skeletons; $body marks where the streamed template content goes
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang='en'>
+<head>
+    <meta charset='UTF-8'>
+    <meta name='viewport' content='width=device-width, initial-scale=1.0'>
+    <title>$title</title>
+    <style>
+$css
+    </style>
+</head>
+<body>
+"""
+_TEMPLATE_SKELETONS = {
+    'default': _HTML_HEAD + """    <div class='container'>
+        <h1 class='main-title'>$title</h1>
+        <p class='generated-info'>Generated on $generated_at</p>
+$body    </div>
+</body>
+</html>""",
+    'minimal': _HTML_HEAD + """    <h1>$title</h1>
+$body</body>
+</html>""",
+    'grid': _HTML_HEAD + """    <div class='grid-container'>
+        <h1 class='header'>$title</h1>
+$body    </div>
+</body>
+</html>""",
+}
+
+@lru_cache(maxsize=None)
+def _get_compiled_template(template: str) -> Tuple[string.Template, str, str]:
+    """Return the (head, tail, css) parts of a template, compiled once per process."""
+    head, tail = _TEMPLATE_SKELETONS[template].split('$body')
+    # Styles live in per-template modules next to this one, so only the chosen
+    # one is loaded; resolve them inside our package when imported as part of one
+    module = f'{__package__}._css_{template}' if __package__ else f'_css_{template}'
+    css = importlib.import_module(module).CSS
+    return string.Template(head), tail, css
 
 class NotebookDashboardGenerator:
     def __init__(self):
@@ -19,197 +128,207 @@ class NotebookDashboardGenerator:
         
     def parse_notebook(self, notebook_path: str) -> Dict[str, Any]:
         """Parse a Jupyter notebook file and extract relevant content."""
-        with open(notebook_path, 'r', encoding='utf-8') as f:
-            notebook = json.load(f)
+        data = Path(notebook_path).read_bytes()
+        notebook = None
+        if orjson:
+            # orjson parses the raw bytes directly and is much faster on large
+            # notebooks, but rejects NaN/Infinity which nbformat may write
+            try:
+                notebook = orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+        if notebook is None:
+            notebook = json.loads(data.decode('utf-8'))
         
         extracted_content = {
-            'title': self._extract_title(notebook),
+            'title': None,
             'plots': [],
             'markdown': [],
             'metadata': notebook.get('metadata', {})
         }
         
+        # The title is taken from the first H1 found while walking the cells
+        title = None
         for cell in notebook.get('cells', []):
-            if cell['cell_type'] == 'markdown':
+            cell_type = cell['cell_type']
+            if cell_type == 'markdown':
                 markdown_text = self._process_markdown_cell(cell)
-                if markdown_text.strip():
-                    extracted_content['markdown'].append(markdown_text)
+                if markdown_text is None:
+                    continue
+                if title is None:
+                    h1_match = _TITLE_H1_RE.search(markdown_text)
+                    if h1_match:
+                        title = h1_match.group(1).strip()
+                extracted_content['markdown'].append(markdown_text)
             
-            elif cell['cell_type'] == 'code':
+            elif cell_type == 'code':
                 plots = self._extract_plots_from_cell(cell)
                 extracted_content['plots'].extend(plots)
         
+        extracted_content['title'] = title if title is not None else "Dashboard"
+        extracted_content['title_html'] = html.escape(extracted_content['title'])
         return extracted_content
     
-    def _extract_title(self, notebook: Dict[str, Any]) -> str:
-        """Extract title from notebook, looking for first H1 markdown or using filename."""
-        for cell in notebook.get('cells', []):
-            if cell['cell_type'] == 'markdown':
-                source = ''.join(cell.get('source', []))
-                # Look for H1 headers
-                h1_match = re.search(r'^#\s+(.+)$', source, re.MULTILINE)
-                if h1_match:
-                    return h1_match.group(1).strip()
-        return "Dashboard"
-    
-    def _process_markdown_cell(self, cell: Dict[str, Any]) -> str:
-        """Process markdown cell content."""
+    def _process_markdown_cell(self, cell: Dict[str, Any]) -> Optional[str]:
+        """Process markdown cell content, returning None for blank cells."""
         source = cell.get('source', [])
         if isinstance(source, list):
+            # Check line by line so whitespace-only spacer cells are never joined
+            if not any(line.strip() for line in source):
+                return None
             return ''.join(source)
-        return str(source)
+        source = str(source)
+        return source if source.strip() else None
     
     def _extract_plots_from_cell(self, cell: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract plot images from code cell outputs."""
         plots = []
-        outputs = cell.get('outputs', [])
         
-        for output in outputs:
+        for output in cell.get('outputs', []):
             # Handle display_data and execute_result outputs
-            if output.get('output_type') in ['display_data', 'execute_result']:
-                data = output.get('data', {})
-                
-                # Look for image data
-                for mime_type in ['image/png', 'image/jpeg', 'image/svg+xml']:
-                    if mime_type in data:
-                        plot_data = {
-                            'mime_type': mime_type,
-                            'data': data[mime_type],
-                            'metadata': output.get('metadata', {})
-                        }
-                        plots.append(plot_data)
+            if output.get('output_type') not in _PLOT_OUTPUT_TYPES:
+                continue
+            data = output.get('data')
+            if not data:
+                continue
+            
+            # Look for image data
+            for mime_type in _IMAGE_MIME_TYPES:
+                plot_data = data.get(mime_type)
+                if plot_data is None:
+                    continue
+                plots.append({
+                    'mime_type': mime_type,
+                    'data': plot_data,
+                    'metadata': output.get('metadata', {})
+                })
         
         return plots
     
     def generate_html_dashboard(self, content: Dict[str, Any], output_path: str, 
-                              template: str = "default") -> None:
+                              template: str = "default",
+                              external_assets: bool = False,
+                              asset_prefix: str = "") -> None:
         """Generate HTML dashboard from extracted content."""
-        html_content = self._create_html_template(content, template)
+        content.setdefault('generated_at', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        if external_assets:
+            content = self._write_external_assets(content, Path(output_path).parent,
+                                                  asset_prefix)
         
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            self._create_html_template(content, template, f)
         
         print(f"Dashboard generated: {output_path}")
     
-    def _create_html_template(self, content: Dict[str, Any], template: str) -> str:
-        """Create HTML template with extracted content."""
+    def _write_external_assets(self, content: Dict[str, Any], asset_dir: Path,
+                               prefix: str = "") -> Dict[str, Any]:
+        """Write plots to files next to the dashboard.
+        
+        Returns a copy of content whose plots reference the written files by
+        name; the caller's content is left untouched so it can be rendered again.
+        """
+        # Only needed for this opt-in path, so keep it off the default import cost
+        import base64
+        
+        plots = []
+        for i, plot in enumerate(content['plots']):
+            data = plot['data']
+            if isinstance(data, list):
+                data = ''.join(data)
+            
+            filename = f"{prefix}plot_{i}.{_ASSET_EXTENSIONS[plot['mime_type']]}"
+            if plot['mime_type'] == 'image/svg+xml':
+                (asset_dir / filename).write_text(data, encoding='utf-8')
+            else:
+                (asset_dir / filename).write_bytes(base64.b64decode(data))
+            
+            plots.append({**plot, 'data': filename, 'external': True})
+        
+        return {**content, 'plots': plots}
+    
+    def _create_html_template(self, content: Dict[str, Any], template: str,
+                              out: TextIO) -> None:
+        """Write HTML template with extracted content to a text stream."""
+        if template not in _TEMPLATE_SKELETONS:
+            template = "default"
+        head, tail, css = _get_compiled_template(template)
+        
+        out.write(head.substitute(
+            title=content.get('title_html') or html.escape(content['title']),
+            css=css,
+            generated_at=content['generated_at'],
+        ))
         if template == "minimal":
-            return self._minimal_template(content)
+            self._minimal_body(content, out)
         elif template == "grid":
-            return self._grid_template(content)
+            self._grid_body(content, out)
         else:
-            return self._default_template(content)
+            self._default_body(content, out)
+        out.write(tail)
     
-    def _default_template(self, content: Dict[str, Any]) -> str:
-        """Default HTML template."""
-        html_parts = [
-            "<!DOCTYPE html>",
-            "<html lang='en'>",
-            "<head>",
-            "    <meta charset='UTF-8'>",
-            "    <meta name='viewport' content='width=device-width, initial-scale=1.0'>",
-            f"    <title>{content['title']}</title>",
-            "    <style>",
-            self._get_default_css(),
-            "    </style>",
-            "</head>",
-            "<body>",
-            "    <div class='container'>",
-            f"        <h1 class='main-title'>{content['title']}</h1>",
-            f"        <p class='generated-info'>Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>",
-        ]
+    def _default_body(self, content: Dict[str, Any], out: TextIO) -> None:
+        """Default template content sections."""
+        w = out.write
         
         # Add content sections
         for i, (markdown, plots) in enumerate(self._pair_content(content)):
-            html_parts.append(f"        <div class='section' id='section-{i}'>")
+            w(f"        <div class='section' id='section-{i}'>\n")
             
             if markdown:
-                html_parts.append("            <div class='markdown-content'>")
-                html_parts.append(f"                {self._markdown_to_html(markdown)}")
-                html_parts.append("            </div>")
+                w("            <div class='markdown-content'>\n")
+                w("                ")
+                w(self._markdown_to_html(markdown))
+                w("\n            </div>\n")
             
             if plots:
-                html_parts.append("            <div class='plots-container'>")
+                w("            <div class='plots-container'>\n")
                 for plot in plots:
-                    html_parts.append(self._plot_to_html(plot))
-                html_parts.append("            </div>")
+                    self._plot_to_html(plot, w)
+                    w("\n")
+                w("            </div>\n")
             
-            html_parts.append("        </div>")
-        
-        html_parts.extend([
-            "    </div>",
-            "</body>",
-            "</html>"
-        ])
-        
-        return '\n'.join(html_parts)
+            w("        </div>\n")
     
-    def _minimal_template(self, content: Dict[str, Any]) -> str:
-        """Minimal HTML template."""
-        html_parts = [
-            "<!DOCTYPE html>",
-            "<html lang='en'>",
-            "<head>",
-            "    <meta charset='UTF-8'>",
-            "    <meta name='viewport' content='width=device-width, initial-scale=1.0'>",
-            f"    <title>{content['title']}</title>",
-            "    <style>",
-            self._get_minimal_css(),
-            "    </style>",
-            "</head>",
-            "<body>",
-            f"    <h1>{content['title']}</h1>",
-        ]
+    def _minimal_body(self, content: Dict[str, Any], out: TextIO) -> None:
+        """Minimal template content."""
+        w = out.write
         
         # Simple sequential layout
         for markdown in content['markdown']:
-            html_parts.append(f"    <div class='content'>{self._markdown_to_html(markdown)}</div>")
+            w("    <div class='content'>")
+            w(self._markdown_to_html(markdown))
+            w("</div>\n")
         
         for plot in content['plots']:
-            html_parts.append(f"    <div class='plot'>{self._plot_to_html(plot)}</div>")
-        
-        html_parts.extend(["</body>", "</html>"])
-        return '\n'.join(html_parts)
+            w("    <div class='plot'>")
+            self._plot_to_html(plot, w)
+            w("</div>\n")
     
-    def _grid_template(self, content: Dict[str, Any]) -> str:
-        """Grid-based HTML template."""
-        html_parts = [
-            "<!DOCTYPE html>",
-            "<html lang='en'>",
-            "<head>",
-            "    <meta charset='UTF-8'>",
-            "    <meta name='viewport' content='width=device-width, initial-scale=1.0'>",
-            f"    <title>{content['title']}</title>",
-            "    <style>",
-            self._get_grid_css(),
-            "    </style>",
-            "</head>",
-            "<body>",
-            "    <div class='grid-container'>",
-            f"        <h1 class='header'>{content['title']}</h1>",
-        ]
+    def _grid_body(self, content: Dict[str, Any], out: TextIO) -> None:
+        """Grid template items."""
+        w = out.write
         
         # Create grid items
         item_count = 0
         for markdown in content['markdown']:
             if markdown.strip():
-                html_parts.append(f"        <div class='grid-item text-item'>{self._markdown_to_html(markdown)}</div>")
+                w("        <div class='grid-item text-item'>")
+                w(self._markdown_to_html(markdown))
+                w("</div>\n")
                 item_count += 1
         
         for plot in content['plots']:
-            html_parts.append(f"        <div class='grid-item plot-item'>{self._plot_to_html(plot)}</div>")
+            w("        <div class='grid-item plot-item'>")
+            self._plot_to_html(plot, w)
+            w("</div>\n")
             item_count += 1
-        
-        html_parts.extend(["    </div>", "</body>", "</html>"])
-        return '\n'.join(html_parts)
     
-    def _pair_content(self, content: Dict[str, Any]) -> List[tuple]:
+    def _pair_content(self, content: Dict[str, Any]) -> Iterator[tuple]:
         """Pair markdown and plots together logically."""
         markdown_items = content['markdown']
         plot_items = content['plots']
         
         # Simple pairing strategy: alternate between markdown and plots
-        pairs = []
         md_idx = 0
         plot_idx = 0
         
@@ -222,189 +341,105 @@ class NotebookDashboardGenerator:
                 current_plots.append(plot_items[plot_idx])
                 plot_idx += 1
             
-            pairs.append((current_md, current_plots))
+            yield current_md, current_plots
             if current_md:
                 md_idx += 1
-        
-        return pairs
     
     def _markdown_to_html(self, markdown: str) -> str:
         """Convert basic markdown to HTML."""
-        html = markdown
-        
-        # Headers
-        html = re.sub(r'^### (.+)$', r'<h3>\1</h3>', html, flags=re.MULTILINE)
-        html = re.sub(r'^## (.+)$', r'<h2>\1</h2>', html, flags=re.MULTILINE)
-        html = re.sub(r'^# (.+)$', r'<h1>\1</h1>', html, flags=re.MULTILINE)
-        
-        # Bold and italic
-        html = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html)
-        html = re.sub(r'\*(.+?)\*', r'<em>\1</em>', html)
-        
-        # Code blocks
-        html = re.sub(r'```(.+?)```', r'<pre><code>\1</code></pre>', html, flags=re.DOTALL)
-        html = re.sub(r'`(.+?)`', r'<code>\1</code>', html)
-        
-        # Line breaks
-        html = html.replace('\n\n', '</p><p>')
-        html = f'<p>{html}</p>'
-        
-        return html
+        # Headers, emphasis, code and paragraph breaks in a single pass
+        return f'<p>{_MD_COMBINED.sub(_md_replace, markdown)}</p>'
     
-    def _plot_to_html(self, plot: Dict[str, Any]) -> str:
-        """Convert plot data to HTML img tag."""
+    def _plot_to_html(self, plot: Dict[str, Any], write: Callable[[str], Any]) -> None:
+        """Write plot data as HTML, emitting the payload without copying it."""
         mime_type = plot['mime_type']
         data = plot['data']
+        if isinstance(data, list):
+            data = ''.join(data)
         
-        if mime_type == 'image/svg+xml':
-            if isinstance(data, list):
-                data = ''.join(data)
-            return f'<div class="plot-svg">{data}</div>'
+        if plot.get('external'):
+            # Asset written next to the dashboard, reference it by file name
+            write('<img src="')
+            write(html.escape(quote(data)))
+            write('" alt="Plot" class="plot-image">')
+        elif mime_type == 'image/svg+xml':
+            write('<div class="plot-svg">')
+            write(data)
+            write('</div>')
         else:
             # For PNG/JPEG, create data URL
-            if isinstance(data, list):
-                data = ''.join(data)
-            return f'<img src="data:{mime_type};base64,{data}" alt="Plot" class="plot-image">'
+            write('<img src="data:')
+            write(mime_type)
+            write(';base64,')
+            write(data)
+            write('" alt="Plot" class="plot-image">')
+
+def _convert_one(job: Tuple[Path, Path, str, bool]) -> bool:
+    """Convert a single notebook in batch mode; runs in a worker process."""
+    notebook_path, output_path, template, external_assets = job
+    generator = NotebookDashboardGenerator()
     
-    def _get_default_css(self) -> str:
-        """Default CSS styles."""
-        return """
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            line-height: 1.6;
-            margin: 0;
-            padding: 0;
-            background-color: #f5f5f5;
-        }
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: white;
-            box-shadow: 0 0 10px rgba(0,0,0,0.1);
-        }
-        .main-title {
-            color: #333;
-            border-bottom: 3px solid #007acc;
-            padding-bottom: 10px;
-            margin-bottom: 30px;
-        }
-        .generated-info {
-            color: #666;
-            font-style: italic;
-            margin-bottom: 30px;
-        }
-        .section {
-            margin-bottom: 40px;
-            padding: 20px;
-            border-left: 4px solid #007acc;
-            background-color: #fafafa;
-        }
-        .markdown-content {
-            margin-bottom: 20px;
-        }
-        .plots-container {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 20px;
-            justify-content: center;
-        }
-        .plot-image, .plot-svg {
-            max-width: 100%;
-            height: auto;
-            border: 1px solid #ddd;
-            border-radius: 5px;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        }
-        h1, h2, h3 { color: #333; }
-        code {
-            background-color: #f0f0f0;
-            padding: 2px 4px;
-            border-radius: 3px;
-            font-family: 'Courier New', monospace;
-        }
-        pre {
-            background-color: #f0f0f0;
-            padding: 10px;
-            border-radius: 5px;
-            overflow-x: auto;
-        }
-        """
+    try:
+        content = generator.parse_notebook(str(notebook_path))
+        # Prefix asset names so dashboards sharing an output directory don't collide
+        generator.generate_html_dashboard(content, str(output_path), template,
+                                          external_assets, f"{output_path.stem}_")
+        return True
+    except Exception as e:
+        print(f"Error generating dashboard for '{notebook_path}': {str(e)}")
+        return False
+
+def run_batch(notebook_dir: str, out_dir: Optional[str], template: str,
+              external_assets: bool = False) -> None:
+    """Convert every notebook in a directory in parallel, one process per CPU."""
+    out = Path(out_dir) if out_dir else Path(notebook_dir)
+    out.mkdir(parents=True, exist_ok=True)
     
-    def _get_minimal_css(self) -> str:
-        """Minimal CSS styles."""
-        return """
-        body {
-            font-family: Arial, sans-serif;
-            margin: 20px;
-            line-height: 1.5;
-        }
-        .content, .plot {
-            margin-bottom: 20px;
-        }
-        .plot-image, .plot-svg {
-            max-width: 100%;
-            height: auto;
-        }
-        """
+    paths = sorted(Path(notebook_dir).glob('*.ipynb'))
+    if not paths:
+        print(f"No notebooks found in '{notebook_dir}'")
+        return
     
-    def _get_grid_css(self) -> str:
-        """Grid CSS styles."""
-        return """
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-        }
-        .grid-container {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 20px;
-            max-width: 1400px;
-            margin: 0 auto;
-        }
-        .header {
-            grid-column: 1 / -1;
-            text-align: center;
-            color: white;
-            margin-bottom: 20px;
-            font-size: 2.5em;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-        }
-        .grid-item {
-            background: white;
-            padding: 20px;
-            border-radius: 10px;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-            transition: transform 0.3s ease;
-        }
-        .grid-item:hover {
-            transform: translateY(-5px);
-        }
-        .plot-item {
-            display: flex;
-            justify-content: center;
-            align-items: center;
-        }
-        .plot-image, .plot-svg {
-            max-width: 100%;
-            height: auto;
-            border-radius: 5px;
-        }
-        """
+    jobs = [(path, out / path.with_suffix('.html').name, template, external_assets)
+            for path in paths]
+    
+    print(f"Converting {len(jobs)} notebooks with '{template}' template...")
+    with Pool() as pool:
+        results = pool.map(_convert_one, jobs)
+    
+    print(f"Batch complete: {sum(results)} of {len(jobs)} dashboards created in {out}")
 
 def main():
     parser = argparse.ArgumentParser(description='Generate static dashboards from Jupyter Notebooks')
-    parser.add_argument('notebook', help='Path to the Jupyter notebook file')
-    parser.add_argument('-o', '--output', help='Output HTML file path', 
-                       default='dashboard.html')
+    parser.add_argument('notebook', nargs='?', help='Path to the Jupyter notebook file')
+    parser.add_argument('-o', '--output', help='Output HTML file path (default: dashboard.html)')
     parser.add_argument('-t', '--template', choices=['default', 'minimal', 'grid'],
                        default='default', help='Template style')
+    parser.add_argument('--external-assets', action='store_true',
+                       help='Write plots to separate files next to the dashboard instead of embedding them')
+    parser.add_argument('--batch', metavar='DIR',
+                       help='Convert every notebook in DIR in parallel')
+    parser.add_argument('--out-dir', metavar='OUT',
+                       help='Output directory for --batch (defaults to DIR)')
     
     args = parser.parse_args()
     
+    if args.batch:
+        if args.notebook is not None or args.output is not None:
+            parser.error('--batch cannot be combined with a notebook path or -o/--output; use --out-dir')
+        if not Path(args.batch).is_dir():
+            print(f"Error: Batch directory '{args.batch}' not found")
+            return
+        run_batch(args.batch, args.out_dir, args.template, args.external_assets)
+        return
+    
+    if args.notebook is None:
+        parser.error('a notebook path is required unless --batch is given')
+    if args.out_dir is not None:
+        parser.error('--out-dir is only valid with --batch; use -o/--output')
+    if args.output is None:
+        args.output = 'dashboard.html'
+    
     if not Path(args.notebook).exists():
         print(f"Error: Notebook file '{args.notebook}' not found")
         return
@@ -418,7 +453,8 @@ def main():
         print(f"Found {len(content['plots'])} plots and {len(content['markdown'])} markdown cells")
         
         print(f"Generating HTML dashboard with '{args.template}' template...")
-        generator.generate_html_dashboard(content, args.output, args.template)
+        generator.generate_html_dashboard(content, args.output, args.template,
+                                          args.external_assets)
         
         print(f"Dashboard successfully created: {args.output}")
         
@@ -0,0 +1,29 @@
+"""
+Regression checks for markdown conversion in notebook_dashboard.
+Expected strings are the output of the original multi-pass converter.
+"""
+
+import unittest
+
+from notebook_dashboard import NotebookDashboardGenerator
+
+
+class MarkdownToHtmlTest(unittest.TestCase):
+    def setUp(self):
+        self.generator = NotebookDashboardGenerator()
+
+    def test_bold_nested_in_italic(self):
+        self.assertEqual(self.generator._markdown_to_html('*a **b** c*'),
+                         '<p><em>a <strong>b</strong> c</em></p>')
+
+    def test_italic_nested_in_bold(self):
+        self.assertEqual(self.generator._markdown_to_html('**a *b* c**'),
+                         '<p><strong>a <em>b</em> c</strong></p>')
+
+    def test_bold_italic_is_well_formed(self):
+        # The original converter emitted mis-nested <strong><em>x</strong></em>
+        self.assertEqual(self.generator._markdown_to_html('***x***'),
+                         '<p><strong><em>x</em></strong></p>')
+
+if __name__ == "__main__":
+    unittest.main()